@@ -3,7 +3,6 @@
 import glob
 import logging
 import os
-import re
 import warnings
 
 import dateutil
@@ -15,8 +14,13 @@ from resdata.resfile import ResdataKW
 
 from .ensemblecombination import EnsembleCombination
 from .etc import Interaction  # noqa
-from .realization import ScratchRealization, parse_number
-from .util import shortcut2path
+from .realization import ScratchRealization
+from .util import (
+    GROUPBYCOLUMNCANDIDATES,
+    QUANTILEMATCHER,
+    parse_number,
+    shortcut2path,
+)
 from .util.dates import unionize_smry_dates
 from .virtualensemble import VirtualEnsemble
 from .virtualrealization import VirtualRealization
@@ -160,7 +164,7 @@ class ScratchEnsemble(object):
         """
         allkeys = set()
         for realization in self.realizations.values():
-            allkeys = allkeys.union(realization.keys())
+            allkeys.update(realization.keys())
         return list(allkeys)
 
     def add_realizations(
@@ -1132,9 +1136,13 @@ class ScratchEnsemble(object):
         # Build a dictionary of dataframes to be concatenated
         dframes = {}
         dframes["mean"] = dframe.mean()
-        for quantile in quantiles:
-            quantile_str = "p" + str(quantile)
-            dframes[quantile_str] = dframe.quantile(q=quantile / 100.0)
+        if quantiles:
+            # All quantiles are computed from one sort of each date group
+            qvalues = sorted({quantile / 100.0 for quantile in quantiles})
+            quantileframe = dframe.quantile(q=qvalues)
+            for quantile in quantiles:
+                quantile_str = "p" + str(quantile)
+                dframes[quantile_str] = quantileframe.xs(quantile / 100.0, level=-1)
         dframes["maximum"] = dframe.max()
         dframes["minimum"] = dframe.min()
 
@@ -1221,7 +1229,8 @@ class ScratchEnsemble(object):
         Arguments:
             aggregation: string, supported modes are
                 'mean', 'median', 'p10', 'p90', 'min',
-                'max', 'std, 'var', 'pXX' where X is a number
+                'max', 'std, 'var', 'pXX' where XX is a number
+                between 0 and 100
             keylist: list of strings, indicating which keys
                 in the internal datastore to include. If list is empty
                 (default), all data will be attempted included.
@@ -1232,55 +1241,45 @@ class ScratchEnsemble(object):
 
         WARNING: This code is duplicated in virtualensemble.py
         """
-        quantilematcher = re.compile(r"p(\d\d)")
+        quantilematch = QUANTILEMATCHER.match(aggregation)
         supported_aggs = ["mean", "median", "min", "max", "std", "var"]
-        if aggregation not in supported_aggs and not quantilematcher.match(aggregation):
+        if aggregation not in supported_aggs and not quantilematch:
             raise ValueError(
-                "{arg} is not a".format(arg=aggregation)
-                + "supported ensemble aggregation"
+                "{arg} is not a supported ensemble aggregation".format(arg=aggregation)
             )
 
         # Generate a new empty object:
         vreal = VirtualRealization(self.name + " " + aggregation)
 
-        # Determine keys to use
+        # Determine keys to use. The union of keys in all realizations
+        # is only computed once.
+        allkeys = self.keys()
         if isinstance(keylist, str):
             keylist = [keylist]
         if not keylist:  # Empty list means all keys.
             if not isinstance(excludekeys, list):
                 excludekeys = [excludekeys]
-            keys = set(self.keys()) - set(excludekeys)
+            keys = set(allkeys) - set(excludekeys)
         else:
             keys = keylist
 
         for key in keys:
             # Aggregate over this ensemble:
             # Ensure we operate on fully qualified localpath's
-            key = shortcut2path(self.keys(), key)
+            key = shortcut2path(allkeys, key)
             data = self.get_df(key)
 
             # This column should never appear in aggregated data
             del data["REAL"]
 
-            # Look for data we should group by. This would be beneficial
-            # to get from a metadata file, and not by pure guesswork.
-            groupbycolumncandidates = [
-                "DATE",
-                "FIPNUM",
-                "ZONE",
-                "REGION",
-                "JOBINDEX",
-                "Zone",
-                "Region_index",
-            ]
-
             # Pick up string columns (or non-numeric values)
             # (when strings are used as values, this breaks, but it is also
             # meaningless to aggregate them. Most likely, strings in columns
             # is a label we should group over)
             stringcolumns = [x for x in data.columns if data.dtypes[x] == "object"]
 
-            groupby = [x for x in groupbycolumncandidates if x in data.columns]
+            # Look for data we should group by.
+            groupby = [x for x in GROUPBYCOLUMNCANDIDATES if x in data.columns]
 
             # Add remainding string columns to columns to group by unless
             # we are working with the STATUS dataframe, which has too many strings..
@@ -1293,8 +1292,7 @@ class ScratchEnsemble(object):
             )
             data = data[numerical_and_groupby_cols]
 
-            dtypes = data.dtypes.unique()
-            if not (int in dtypes or float in dtypes):
+            if data.select_dtypes(include="number").empty:
                 logger.info("No numerical data to aggregate in %s", key)
                 continue
             if groupby:
@@ -1303,8 +1301,8 @@ class ScratchEnsemble(object):
             else:
                 aggobject = data
 
-            if quantilematcher.match(aggregation):
-                quantile = int(quantilematcher.match(aggregation).group(1))
+            if quantilematch:
+                quantile = int(quantilematch.group(1))
                 aggregated = aggobject.quantile(quantile / 100.0)
             else:
                 # Passing through the variable 'aggregation' to
@@ -239,8 +239,9 @@ class EnsembleCombination(object):
             .groupby("DATE")
         )
         mean = dframe.mean()
-        p90 = dframe.quantile(q=0.90)
-        p10 = dframe.quantile(q=0.10)
+        quantileframe = dframe.quantile(q=[0.10, 0.90])
+        p10 = quantileframe.xs(0.10, level=-1)
+        p90 = quantileframe.xs(0.90, level=-1)
         maximum = dframe.max()
         minimum = dframe.min()
 
@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 
 from .ensemble import ScratchEnsemble, VirtualEnsemble
+from .util import shortcut2path
 
 logger = logging.getLogger(__name__)
 
@@ -526,29 +527,8 @@ class EnsembleSet(object):
 
         but only as long as there is no ambiguity. In case
         of ambiguity, the shortpath will be returned.
-
-        CODE DUPLICATION from realization.py
         """
-        basenames = [os.path.basename(key) for key in self.keys()]
-        if basenames.count(shortpath) == 1:
-            short2path = {os.path.basename(x): x for x in self.keys()}
-            return short2path[shortpath]
-        noexts = ["".join(x.split(".")[:-1]) for x in self.keys()]
-        if noexts.count(shortpath) == 1:
-            short2path = {"".join(x.split(".")[:-1]): x for x in self.keys()}
-            return short2path[shortpath]
-        basenamenoexts = [
-            "".join(os.path.basename(x).split(".")[:-1]) for x in self.keys()
-        ]
-        if basenamenoexts.count(shortpath) == 1:
-            short2path = {
-                "".join(os.path.basename(x).split(".")[:-1]): x for x in self.keys()
-            }
-            return short2path[shortpath]
-        # If we get here, we did not find anything that
-        # this shorthand could point to. Return as is, and let the
-        # calling function handle further errors.
-        return shortpath
+        return shortcut2path(self.keys(), shortpath)
 
     def get_csv_deprecated(self, filename):
         """Load CSV data from each realization in each
@@ -9,6 +9,7 @@ import os
 from collections import OrderedDict
 
 import dateutil
+import numpy as np
 import pandas as pd
 import yaml
 
@@ -251,6 +252,7 @@ class Observations(object):
         # mismatch_df = pd.DataFrame(columns=['OBSTYPE', 'OBSKEY',
         #     'DATE', 'OBSINDEX', 'MISMATCH', 'L1', 'L2', 'SIGN'])
         mismatches = []
+        smry_values = self._smry_values(real) if "smry" in self.observations else {}
         for obstype in self.observations.keys():
             for obsunit in self.observations[obstype]:  # (list)
                 if obstype == "txt":
@@ -366,20 +368,27 @@ class Observations(object):
                 if obstype == "smry":
                     # For 'smry', there is a list of
                     # observations (indexed by date)
-                    for unit in obsunit["observations"]:
-                        try:
-                            sim_value = real.get_smry(
-                                time_index=[unit["date"]], column_keys=obsunit["key"]
-                            )[obsunit["key"]].values[0]
-                        except KeyError:
-                            logger.warning(
-                                "No data found for smry: %s at %s, ignored.",
-                                obsunit["key"],
-                                str(unit["date"]),
-                            )
-                            continue
-                        mismatch = float(sim_value - unit["value"])
-                        sign = (mismatch > 0) - (mismatch < 0)
+                    key_values = smry_values.get(obsunit["key"], {})
+                    units = [
+                        unit
+                        for unit in obsunit["observations"]
+                        if pd.Timestamp(unit["date"]) in key_values
+                    ]
+                    if not units:
+                        continue
+                    sim_values = np.array(
+                        [key_values[pd.Timestamp(unit["date"])] for unit in units]
+                    )
+                    mismatch = sim_values - np.array(
+                        [unit["value"] for unit in units], dtype=float
+                    )
+                    for unit, sim_value, unit_mismatch, sign in zip(
+                        units,
+                        sim_values,
+                        mismatch.tolist(),
+                        # Missing simulated values give NaN and zero sign
+                        np.sign(np.nan_to_num(mismatch)).astype(int).tolist(),
+                    ):
                         mismatches.append(
                             {
                                 "OBSTYPE": "smry",
@@ -387,16 +396,58 @@ class Observations(object):
                                 "DATE": unit["date"],
                                 "MEASERROR": unit["error"],
                                 "LABEL": unit.get("label", ""),
-                                "MISMATCH": mismatch,
+                                "MISMATCH": unit_mismatch,
                                 "OBSVALUE": unit["value"],
                                 "SIMVALUE": sim_value,
-                                "L1": abs(mismatch),
-                                "L2": abs(mismatch) ** 2,
+                                "L1": abs(unit_mismatch),
+                                "L2": abs(unit_mismatch) ** 2,
                                 "SIGN": sign,
                             }
                         )
         return pd.DataFrame(mismatches)
 
+    def _smry_values(self, real):
+        """Obtain simulated values for all dates in the smry observations
+
+        Summary data is interpolated with one get_smry() call for each
+        summary key, also when the key is used in several observation units.
+        If that fails, each date is tried on its own.
+
+        Args:
+            real : ScratchRealization or VirtualRealization
+        Returns:
+            dict: Simulated values pr. date (as pd.Timestamp) in a dict, for
+                each summary key. Dates not found in the realization
+                are not included.
+        """
+        # Observation dates can be both dates and datetimes, which
+        # do not compare, so they are all converted to Timestamps.
+        dates_pr_key = {}
+        for obsunit in self.observations["smry"]:
+            dates_pr_key.setdefault(obsunit["key"], set()).update(
+                pd.Timestamp(unit["date"]) for unit in obsunit["observations"]
+            )
+        smry_values = {}
+        for key, dates in dates_pr_key.items():
+            dates = sorted(dates)
+            try:
+                values = real.get_smry(time_index=dates, column_keys=key)[key].values
+                smry_values[key] = dict(zip(dates, values))
+                continue
+            except KeyError:
+                pass
+            smry_values[key] = {}
+            for date in dates:
+                try:
+                    smry_values[key][date] = real.get_smry(
+                        time_index=[date], column_keys=key
+                    )[key].values[0]
+                except KeyError:
+                    logger.warning(
+                        "No data found for smry: %s at %s, ignored.", key, str(date)
+                    )
+        return smry_values
+
     def _realization_misfit(self, real, defaulterrors=False, corr=None):
         """The misfit value for the observation set
 
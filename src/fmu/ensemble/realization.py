@@ -26,8 +26,8 @@ from resdata.resfile import ResdataFile
 from resdata.summary import Summary
 
 from .realizationcombination import RealizationCombination
-from .util import flatten, parse_number, shortcut2path
-from .util.dates import unionize_smry_dates
+from .util import ShortcutCache, flatten, parse_number
+from .util.dates import parse_date, unionize_smry_dates
 from .util.rates import compute_volumetric_rates
 from .virtualrealization import VirtualRealization
 
@@ -119,6 +119,8 @@ class ScratchRealization(object):
         # indexed by filenames (local to the realization).
         # values in the dictionary can be either dicts or dataframes
         self.data = {}
+        # Cache for shortcut2path() lookups in self.data
+        self._shortcuts = ShortcutCache()
         self._eclinit = None
         self._eclunrst = None
         self._eclgrid = None
@@ -547,16 +549,16 @@ class ScratchRealization(object):
         # Calculate duration. Only Python 3.6 has time.fromisoformat().
         # Warning: Unpandaic code..
         durations = []
-        for _, jobrow in status.iterrows():
-            if not jobrow["ENDTIME"]:  # A job that is not finished.
+        for starttime, endtime in zip(status["STARTTIME"], status["ENDTIME"]):
+            if not endtime:  # A job that is not finished.
                 durations.append(np.nan)
             else:
                 try:
-                    hms = list(map(int, jobrow["STARTTIME"].split(":")))
+                    hms = list(map(int, starttime.split(":")))
                     start = datetime.combine(
                         date.today(), time(hour=hms[0], minute=hms[1], second=hms[2])
                     )
-                    hms = list(map(int, jobrow["ENDTIME"].split(":")))
+                    hms = list(map(int, endtime.split(":")))
                     end = datetime.combine(
                         date.today(), time(hour=hms[0], minute=hms[1], second=hms[2])
                     )
@@ -692,10 +694,10 @@ class ScratchRealization(object):
             KeyError if data is not found.
             TypeError if data in localpath or merge is not of a mergeable type
         """
-        fullpath = shortcut2path(self.keys(), localpath)
+        fullpath = self._shortcuts.resolve(self.keys(), localpath)
         if fullpath not in self.data.keys():
             raise KeyError("Could not find {}".format(localpath))
-        data = self.data[shortcut2path(self.keys(), localpath)]
+        data = self.data[fullpath]
         if not isinstance(merge, list):
             merge = [merge]  # can still be None
         if merge and merge[0] is not None:
@@ -1358,7 +1360,7 @@ class ScratchRealization(object):
             criteria.
         """
         kwargs.pop("inplace", 0)
-        localpath = shortcut2path(self.keys(), localpath)
+        localpath = self._shortcuts.resolve(self.keys(), localpath)
         if localpath not in self.keys():
             return False
         if not kwargs:
@@ -1383,7 +1385,7 @@ class ScratchRealization(object):
                 # otherwise we revert to simpler check.
                 if kwargs["column"] == "DATE":
                     return (
-                        pd.to_datetime(dateutil.parser.parse(kwargs["columncontains"]))
+                        parse_date(kwargs["columncontains"])
                         == pd.to_datetime(self.data[localpath][kwargs["column"]])
                     ).any()
                 return (
@@ -1422,7 +1424,7 @@ class ScratchRealization(object):
                 dataframes
             keys: list of strings of keys to delete from a dictionary
         """
-        fullpath = shortcut2path(self.keys(), localpath)
+        fullpath = self._shortcuts.resolve(self.keys(), localpath)
         if fullpath not in self.keys():
             raise ValueError("%s not found" % localpath)
 
@@ -1438,11 +1440,18 @@ class ScratchRealization(object):
             if "columns" in kwargs:
                 data.drop(labels=kwargs["columns"], axis="columns", inplace=True)
             if "rowcontains" in kwargs:
-                # Construct boolean series for those rows that have a match
-                boolseries = (data.astype(str) == str(kwargs["rowcontains"])).any(
-                    axis="columns"
+                # Construct boolean mask for those rows that have a match
+                mask = (
+                    (data.astype(str) == str(kwargs["rowcontains"]))
+                    .any(axis="columns")
+                    .values
                 )
-                self.data[fullpath] = data[~boolseries]
+                if data.index.is_unique:
+                    # Drop in place, avoids copying all the surviving rows:
+                    data.drop(index=data.index[mask], inplace=True)
+                else:
+                    # Label based dropping is ambiguous here.
+                    self.data[fullpath] = data[~mask]
         if isinstance(data, dict):
             if "keys" in kwargs:
                 for key in kwargs["keys"]:
@@ -2,6 +2,7 @@
 
 import fnmatch
 import logging
+import re
 
 import numpy as np
 import pandas as pd
@@ -17,6 +18,9 @@ class RealizationCombination(object):
     evaluation.
     """
 
+    # Deep expressions consist of many nodes, avoid a __dict__ for each.
+    __slots__ = ("ref", "scale", "add", "sub", "_terms", "_repr")
+
     def __init__(self, ref, scale=None, add=None, sub=None):
         """Set up an object for a linear combination of realizations.
 
@@ -40,7 +44,8 @@ class RealizationCombination(object):
         """
 
         self.ref = ref
-        if scale:
+        if scale is not None:
+            # Zero is a valid scale
             self.scale = scale
         else:
             self.scale = 1
@@ -57,16 +62,24 @@ class RealizationCombination(object):
         else:
             self.sub = None
 
+        # The expression tree is not modified after construction, and is
+        # evaluated as a linear combination of its leaves, the realizations.
+        self._terms = self._linearize()
+
+        # The expression string is rendered on first use of __repr__
+        self._repr = None
+
     def keys(self):
         """Return the intersection of all keys available in reference
         realization(combination) and the other
         """
-        combkeys = set()
-        combkeys = combkeys.union(self.ref.keys())
-        if self.add:
-            combkeys = combkeys.intersection(self.add.keys())
-        if self.sub:
-            combkeys = combkeys.intersection(self.sub.keys())
+        # Keys are not cached, as the realizations can load or drop data
+        keysets = [leaf.keys() for _, leaf in self._terms]
+        # Start with the smallest set, the intersection can only shrink.
+        keysets.sort(key=len)
+        combkeys = set(keysets[0])
+        for keyset in keysets[1:]:
+            combkeys.intersection_update(keyset)
         return combkeys
 
     def get_df(self, localpath, merge=None):
@@ -98,50 +111,51 @@ class RealizationCombination(object):
             for the requested data to merge in. TypeError if scalar values
             are strings and they are multiplied with scalar.
         """
-        # We can pandas.add when the index is set correct.
-        # WE MUST GUESS!
-        indexlist = []
-        indexcandidates = ["DATE", "ZONE", "REGION"]
-        refdf = self.ref.get_df(localpath, merge=merge)
-        if isinstance(refdf, pd.DataFrame):
-            for index in indexcandidates:
-                if index in refdf.columns:
-                    indexlist.append(index)
-            refdf = refdf.set_index(indexlist)
-            refdf = refdf.select_dtypes(include="number")
-        elif isinstance(refdf, dict):
-            # Convert from dicts to Series, for linear algebra to be defined
-            refdf = pd.Series(refdf)
-        if isinstance(refdf, (int, float, np.number)):
-            result = self.scale * refdf
-        elif isinstance(refdf, str):
+        # Each leaf in the expression is only asked for its data once.
+        coefs = [coef for coef, _ in self._terms]
+        values = [leaf.get_df(localpath, merge=merge) for _, leaf in self._terms]
+        if isinstance(values[0], str):
             logger.warning("String data %s ignored", localpath)
             return None
-        else:
-            # Pandas dataframe or series:
-            result = refdf.mul(self.scale)
-        if self.add:
-            otherdf = self.add.get_df(localpath, merge=merge)
-            if isinstance(otherdf, pd.DataFrame):
-                otherdf = otherdf.set_index(indexlist)
-                otherdf = otherdf.select_dtypes(include="number")
-            elif isinstance(otherdf, dict):
-                otherdf = pd.Series(otherdf)
-            if isinstance(otherdf, (int, float, np.number)):
-                result = result + otherdf
-            else:
-                result = result.add(otherdf)
-        if self.sub:
-            otherdf = self.sub.get_df(localpath, merge=merge)
-            if isinstance(otherdf, pd.DataFrame):
-                otherdf = otherdf.set_index(indexlist)
-                otherdf = otherdf.select_dtypes(include="number")
-            elif isinstance(otherdf, dict):
-                otherdf = pd.Series(otherdf)
-            if isinstance(otherdf, (int, float, np.number)):
-                result = result - otherdf
+
+        # Dictionaries, possibly with scalars added, are combined without
+        # going through pandas.
+        if any(isinstance(value, dict) for value in values) and all(
+            isinstance(value, dict) or _is_number(value) for value in values
+        ):
+            return _combine_dicts(coefs, values)
+
+        # We can do arithmetic on dataframes when the index is set correct.
+        # WE MUST GUESS!
+        if isinstance(values[0], pd.DataFrame):
+            indexcandidates = ["DATE", "ZONE", "REGION"]
+            indexlist = [
+                index for index in indexcandidates if index in values[0].columns
+            ]
+            values = [
+                _prepare(value, indexlist) if isinstance(value, pd.DataFrame) else value
+                for value in values
+            ]
+
+        if all(isinstance(value, pd.DataFrame) for value in values):
+            # Rows and columns where everything is NaN are deleted, which
+            # will be the case when some data does not exist in all
+            # realizations.
+            return _drop_all_nan(_combine_frames(coefs, values)).reset_index()
+        # Scalars, or a mix of datatypes. Convert from dicts to Series,
+        # for linear algebra to be defined
+        result = None
+        for coef, value in zip(coefs, values):
+            if isinstance(value, dict):
+                value = pd.Series(value)
+            if result is None:
+                result = value if coef == 1 else value * coef
+            elif coef == 1:
+                result = result + value
+            elif coef == -1:
+                result = result - value
             else:
-                result = result.sub(otherdf)
+                result = result + value * coef
         if isinstance(result, pd.DataFrame):
             # Delete rows where everything is NaN, which will be case when
             # some data row does not exist in all realizations.
@@ -154,6 +168,36 @@ class RealizationCombination(object):
             return result.dropna().to_dict()
         return result
 
+    def _linearize(self):
+        """Flatten the expression tree into a linear combination of
+        its leaves, the realizations.
+
+        Leaves occuring multiple times in the tree are listed once,
+        with their coefficients summed. Subtrees are already flattened
+        when they are constructed, so this only merges their terms.
+
+        Returns:
+            list of (coefficient, leaf) tuples, ordered by first occurence
+            in the expression.
+        """
+        terms = {}
+
+        def _visit(node, coef):
+            if isinstance(node, RealizationCombination):
+                for leafcoef, leaf in node._terms:
+                    _visit(leaf, coef * leafcoef)
+            elif id(node) in terms:
+                terms[id(node)][0] += coef
+            else:
+                terms[id(node)] = [coef, node]
+
+        _visit(self.ref, self.scale)
+        if self.add:
+            _visit(self.add, 1)
+        if self.sub:
+            _visit(self.sub, -1)
+        return [(coef, leaf) for coef, leaf in terms.values()]
+
     def to_virtual(self, keyfilter=None):
         """Evaluate the current linear combination and return as
         a VirtualRealization.
@@ -178,11 +222,15 @@ class RealizationCombination(object):
         if not isinstance(keyfilter, list):
             raise TypeError("keyfilter in to_virtual() must be list or string")
 
+        # One alternation regex for all patterns, instead of letting
+        # fnmatch translate each pattern for every key.
+        keymatcher = re.compile(
+            "|".join(fnmatch.translate("*" + pattern + "*") for pattern in keyfilter)
+        )
+
         vreal = VirtualRealization(description=str(self))
         for key in self.keys():
-            if sum(
-                [fnmatch.fnmatch(key, "*" + pattern + "*") for pattern in keyfilter]
-            ):
+            if keyfilter and keymatcher.match(key):
                 vreal.append(key, self.get_df(key))
         return vreal
 
@@ -192,18 +240,14 @@ class RealizationCombination(object):
         """Create a union of dates available in the
         involved ensembles
         """
-        dates = set(self.ref.get_smry_dates(freq, normalize, start_date, end_date))
+        dates = [self.ref.get_smry_dates(freq, normalize, start_date, end_date)]
         if self.add:
-            dates = dates.union(
-                set(self.add.get_smry_dates(freq, normalize, start_date, end_date))
-            )
+            dates.append(self.add.get_smry_dates(freq, normalize, start_date, end_date))
         if self.sub:
-            dates = dates.union(
-                set(self.add.get_smry_dates(freq, normalize, start_date, end_date))
-            )
-        dates = list(dates)
-        dates.sort()
-        return dates
+            dates.append(self.sub.get_smry_dates(freq, normalize, start_date, end_date))
+        if len(dates) == 1:
+            return list(dates[0])
+        return np.unique(np.concatenate(dates)).tolist()
 
     def get_smry(self, column_keys=None, time_index=None):
         """
@@ -223,22 +267,17 @@ class RealizationCombination(object):
         """
         if isinstance(time_index, str):
             time_index = self.get_smry_dates(time_index)
-        indexlist = ["DATE"]
-        refdf = self.ref.get_smry(
-            time_index=time_index, column_keys=column_keys
-        ).set_index(indexlist)
-        result = refdf.mul(self.scale)
-        if self.add:
-            otherdf = self.add.get_smry(
-                time_index=time_index, column_keys=column_keys
-            ).set_index(indexlist)
-            result = result.add(otherdf)
-        if self.sub:
-            otherdf = self.sub.get_smry(
-                time_index=time_index, column_keys=column_keys
-            ).set_index(indexlist)
-            result = result.sub(otherdf)
-        return result.reset_index()
+
+        # The leaf realizations return frames indexed by date
+        return _combine_frames(
+            [coef for coef, _ in self._terms],
+            [
+                leaf.get_smry(
+                    time_index=time_index, column_keys=column_keys
+                ).rename_axis("DATE")
+                for _, leaf in self._terms
+            ],
+        ).reset_index()
 
     def get_smry_meta(self, column_keys=None):
         """
@@ -284,6 +323,8 @@ class RealizationCombination(object):
         """Try to give out a linear expression"""
         # NB: Implementation in this method requires scaling not to happen
         # simultaneously as adds or subs.
+        if self._repr is not None:
+            return self._repr
         scalestring = ""
         addstring = ""
         substring = ""
@@ -293,7 +334,8 @@ class RealizationCombination(object):
             addstring = " + " + str(self.add)
         if self.sub:
             substring = " - " + str(self.sub)
-        return scalestring + str(self.ref) + addstring + substring
+        self._repr = scalestring + str(self.ref) + addstring + substring
+        return self._repr
 
     def __sub__(self, other):
         return RealizationCombination(self, sub=other)
@@ -312,3 +354,173 @@ class RealizationCombination(object):
 
     def __rmul__(self, other):
         return RealizationCombination(self, scale=float(other))
+
+
+def _prepare(dframe, indexlist):
+    """Prepare a dataframe for arithmetic with other dataframes, by
+    setting the index and dropping non-numerical columns.
+
+    Args:
+        dframe (pd.DataFrame): Data from a realization
+        indexlist (list of str): Columns to use as index
+
+    Returns:
+        pd.DataFrame
+    """
+    return dframe.set_index(indexlist).select_dtypes(include="number")
+
+
+def _combine_frames(coefs, frames):
+    """Compute the linear combination sum(coef * frame) for dataframes
+    in one pass.
+
+    For float frames with unique labels, the frames are aligned once on
+    the union of their indices and columns, as pandas.DataFrame.add() would
+    do, and the arithmetic is then done on the underlying arrays, avoiding
+    intermediate dataframes. Other frames are combined using pandas
+    arithmetic, which handles duplicated labels and preserves the dtypes.
+
+    Args:
+        coefs (list of float): Coefficient for each frame
+        frames (list of pd.DataFrame): Frames to combine, at least one.
+
+    Returns:
+        pd.DataFrame
+    """
+    if not all(_is_plain_float(frame) for frame in frames):
+        result = frames[0].mul(coefs[0])
+        for coef, frame in zip(coefs[1:], frames[1:]):
+            if coef == 1:
+                result = result.add(frame)
+            elif coef == -1:
+                result = result.sub(frame)
+            else:
+                result = result.add(frame.mul(coef))
+        return result
+
+    index = _union([frame.index for frame in frames])
+    columns = _union([frame.columns for frame in frames])
+
+    def _values(frame, copy=False):
+        if not (frame.index.equals(index) and frame.columns.equals(columns)):
+            frame = frame.reindex(index=index, columns=columns)
+        return frame.to_numpy(dtype=np.float64, na_value=np.nan, copy=copy)
+
+    # The result is accumulated in place, this must not be a view. Keep it
+    # column-major, which is how pandas stores the frame columns, so the
+    # in-place operations stream through memory in the same order as the
+    # operands and the array can be handed over to the result without copying.
+    values = np.asfortranarray(_values(frames[0], copy=True))
+    if coefs[0] != 1:
+        values *= coefs[0]
+    for coef, frame in zip(coefs[1:], frames[1:]):
+        if coef == 1:
+            values += _values(frame)
+        elif coef == -1:
+            values -= _values(frame)
+        else:
+            values += coef * _values(frame)
+    return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+
+def _is_plain_float(dframe):
+    """Check if a dataframe has unique labels and only float64 columns,
+    so that it can be combined through its underlying array"""
+    return (
+        dframe.index.is_unique
+        and dframe.columns.is_unique
+        and (dframe.dtypes == np.float64).all()
+    )
+
+
+def _union(indices):
+    """Compute the sorted union of a list of pandas indices in one go,
+    instead of pairwise.
+
+    Args:
+        indices (list of pd.Index): Indices with unique values
+
+    Returns:
+        pd.Index, the first index if all are equal.
+    """
+    first = indices[0]
+    others = [index for index in indices[1:] if not first.equals(index)]
+    if not others:
+        return first
+    union = first.append(others).unique()
+    try:
+        return union.sort_values()
+    except TypeError:
+        # Unsortable mix of datatypes, keep order of occurence
+        return union
+
+
+def _drop_all_nan(dframe):
+    """Delete rows and columns where everything is NaN in a numerical
+    dataframe, like dropna(how="all") on both axes, but scanning
+    for NaN only once.
+
+    Args:
+        dframe (pd.DataFrame): Frame with numerical values only
+
+    Returns:
+        pd.DataFrame, the input frame if nothing is to be deleted.
+    """
+    isnan = np.isnan(dframe.to_numpy(dtype=np.float64, na_value=np.nan))
+    keep_rows = ~isnan.all(axis=1)
+    keep_columns = ~isnan.all(axis=0)
+    if keep_rows.all() and keep_columns.all():
+        return dframe
+    return dframe.iloc[keep_rows, keep_columns]
+
+
+def _is_number(value):
+    """Check if a value is a number that can be used in the linear combinations"""
+    return isinstance(value, (int, float, np.number))
+
+
+def _combine_dicts(coefs, dicts):
+    """Compute the linear combination sum(coef * dict) for dictionaries
+    with numbers, typically parameters.txt.
+
+    Only keys with numerical values in all the dictionaries are
+    included in the result, similar to what pandas.Series arithmetic
+    followed by dropna() would give, but without any pandas overhead.
+
+    Args:
+        coefs (list of float): Coefficient for each dictionary
+        dicts (list of dict or numbers): Dictionaries to combine, at least
+            one. Keys are ordered as in the first dictionary. Numbers
+            are added to the values for all keys.
+
+    Returns:
+        dict
+    """
+    first = next(dictionary for dictionary in dicts if isinstance(dictionary, dict))
+    keys = [
+        key
+        for key in first
+        if all(
+            _is_number(dictionary.get(key))
+            for dictionary in dicts
+            if isinstance(dictionary, dict)
+        )
+    ]
+
+    # One row pr. dictionary, one column pr. key
+    values = np.empty((len(dicts), len(keys)), dtype=np.float64)
+    for row, dictionary in zip(values, dicts):
+        if isinstance(dictionary, dict):
+            row[:] = np.fromiter(
+                (dictionary[key] for key in keys), dtype=np.float64, count=len(keys)
+            )
+        else:
+            row[:] = dictionary
+    # Not using a matrix product here, as BLAS may skip zero coefficients
+    # and thereby not propagate NaN.
+    result = (np.asarray(coefs, dtype=np.float64)[:, np.newaxis] * values).sum(axis=0)
+    return {
+        key: value
+        for key, value, isnan in zip(keys, result.tolist(), np.isnan(result))
+        if not isnan
+    }
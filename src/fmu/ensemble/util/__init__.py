@@ -1,8 +1,27 @@
 """Common utility functions used in fmu.ensemble"""
 
-import os
+import re
 from collections.abc import MutableMapping
 
+# Plain integer and float strings, which are parsed without trying
+# (and failing) other conversions first. Integers match without any groups.
+NUMBERMATCHER = re.compile(r"[+-]?(?:\d+(\.\d*)?|(\.\d+))([eE][+-]?\d+)?$")
+
+# Quantile aggregations, 'p10', 'p90', 'p05', 'p100' etc.
+QUANTILEMATCHER = re.compile(r"p(100|\d{1,2})$")
+
+# Columns to group by in agg(). This would be beneficial
+# to get from a metadata file, and not by pure guesswork.
+GROUPBYCOLUMNCANDIDATES = (
+    "DATE",
+    "FIPNUM",
+    "ZONE",
+    "REGION",
+    "JOBINDEX",
+    "Zone",
+    "Region_index",
+)
+
 
 def flatten(dictionary, parent_key="", sep="_"):
     """Flatten nested dictionaries by introducing new keys
@@ -19,14 +38,21 @@ def flatten(dictionary, parent_key="", sep="_"):
         dict with only one level.
     """
 
-    items = []
-    for key, value in dictionary.items():
-        new_key = parent_key + sep + key if parent_key else key
-        if isinstance(value, MutableMapping):
-            items.extend(flatten(value, new_key, sep=sep).items())
+    # Walk the nested dictionaries depth-first with a stack of iterators
+    # instead of recursing, keeping the key order of the input.
+    items = {}
+    stack = [(parent_key, iter(dictionary.items()))]
+    while stack:
+        prefix, iterator = stack[-1]
+        for key, value in iterator:
+            new_key = prefix + sep + key if prefix else key
+            if isinstance(value, MutableMapping):
+                stack.append((new_key, iter(value.items())))
+                break
+            items[new_key] = value
         else:
-            items.append((new_key, value))
-    return dict(items)
+            stack.pop()
+    return items
 
 
 def parse_number(value):
@@ -54,6 +80,16 @@ def parse_number(value):
             return value
         except ValueError:
             return value  # return float
+    if isinstance(value, str):
+        if value.isdecimal():
+            return int(value)
+        numbermatch = NUMBERMATCHER.match(value)
+        if numbermatch:
+            if numbermatch.lastindex is None:
+                return int(value)
+            return float(value)
+    # Anything else int() or float() accepts, like surrounding whitespace,
+    # underscores, 'nan' or 'inf':
     try:
         return int(value)
     except ValueError:
@@ -91,19 +127,56 @@ def shortcut2path(keys, shortpath):
         input untouched if nothing is found, or of the shortpath is
         already fully qualified.
     """
-    basenames = list(map(os.path.basename, keys))
-    if basenames.count(shortpath) == 1:
-        short2path = {os.path.basename(x): x for x in keys}
-        return short2path[shortpath]
-    noexts = ["".join(x.split(".")[:-1]) for x in keys]
-    if noexts.count(shortpath) == 1:
-        short2path = {"".join(x.split(".")[:-1]): x for x in keys}
-        return short2path[shortpath]
-    basenamenoexts = ["".join(os.path.basename(x).split(".")[:-1]) for x in keys]
-    if basenamenoexts.count(shortpath) == 1:
-        short2path = {"".join(os.path.basename(x).split(".")[:-1]): x for x in keys}
-        return short2path[shortpath]
+    if shortpath in keys:
+        return shortpath
+    # Keys matching the shortpath as basename, as path without extension
+    # and as basename without extension, in order of precedence. Only a
+    # unique match is used.
+    matches = ([], [], [])
+    for key in keys:
+        # Localpaths always use forward slashes
+        basename = key.rpartition("/")[2]
+        if basename == shortpath:
+            matches[0].append(key)
+        if key.rpartition(".")[0] == shortpath:
+            matches[1].append(key)
+        if basename.rpartition(".")[0] == shortpath:
+            matches[2].append(key)
+    for candidates in matches:
+        if len(candidates) == 1:
+            return candidates[0]
     # If we get here, we did not find anything that
     # this shorthand could point to. Return as is, and let the
     # calling function handle further errors.
     return shortpath
+
+
+class ShortcutCache(object):
+    """Cache for shortcut2path() lookups in a datastore
+
+    Datastores are mutated from many places, so instead of being
+    invalidated explicitly, the cache is tied to a snapshot of the keys
+    it was filled for, and emptied when the keys change.
+    """
+
+    def __init__(self):
+        self._keys = ()
+        self._paths = {}
+
+    def resolve(self, keys, shortpath):
+        """Resolve a shorthand localpath, see shortcut2path()
+
+        Args:
+            keys (list of str): All keys in the datastore
+            shortpath (str): Shorthand or fully qualified localpath
+
+        Returns:
+            str: Fully qualified localpath, or shortpath if not resolvable.
+        """
+        keys = tuple(keys)
+        if keys != self._keys:
+            self._keys = keys
+            self._paths = {}
+        if shortpath not in self._paths:
+            self._paths[shortpath] = shortcut2path(keys, shortpath)
+        return self._paths[shortpath]
@@ -1,6 +1,7 @@
 """Common utility functions used in fmu.ensemble"""
 
 import datetime
+import functools
 import logging
 from typing import List, Tuple
 
@@ -42,6 +43,27 @@ def date_range(start_date, end_date, freq):
         return _fallback_date_range(start_date, end_date, freq)
 
 
+@functools.lru_cache(maxsize=64)
+def parse_date(datestr):
+    """Parse a date string into a pandas Timestamp
+
+    The pandas parser is tried first as it is much faster than dateutil
+    for well-formed (ISO-8601) strings, dateutil is used as a fallback.
+    Results are cached, as the same date string is typically queried
+    for every realization in an ensemble.
+
+    Args:
+        datestr (str): String representation of a date
+
+    Returns:
+        pd.Timestamp
+    """
+    try:
+        return pd.Timestamp(datestr)
+    except ValueError:
+        return pd.to_datetime(dateutil.parser.parse(datestr))
+
+
 def unionize_smry_dates(eclsumsdates, freq, normalize, start_date=None, end_date=None):
     """
     Unionize lists of dates into one datelist encompassing the date
@@ -1,9 +1,8 @@
 """Common utility functions for rates used in fmu.ensemble"""
 
-import calendar
 import logging
 
-import dateutil
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -63,51 +62,21 @@ def compute_volumetric_rates(realization, column_keys, time_index, time_unit):
     cum_df = realization.get_smry(column_keys=column_keys, time_index=time_index)
     # get_smry() for realizations return a dataframe indexed by 'DATE'
 
-    # Compute row-wise difference, shift back one row
-    # to get the NaN to the end, and then drop the NaN.
+    # Compute row-wise difference, stored at the first row of each
+    # interval, and with zero at the last row (and for missing data).
     # The "rate" given for a specific date is then
     # valid from that date until the next date.
-    diff_cum = cum_df.diff().shift(-1).fillna(value=0)
+    cum_values = cum_df.to_numpy(dtype=np.float64)
+    diffs = np.zeros_like(cum_values)
+    np.subtract(cum_values[1:], cum_values[:-1], out=diffs[:-1])
+    diffs[np.isnan(diffs)] = 0
+    diff_cum = pd.DataFrame(diffs, index=cum_df.index, columns=cum_df.columns)
 
     if time_unit:
-        # Calculate the relative timedelta between consecutive
-        # DateIndices. relativedeltas are correct in terms
-        # of number of years and number of months, but it will
-        # only give us integer months, and then leftover days.
-        rel_deltas = [
-            dateutil.relativedelta.relativedelta(t[1], t[0])
-            for t in zip(diff_cum.index, diff_cum.index[1:])
-        ]
-        whole_days = [
-            (t[1] - t[0]).days for t in zip(diff_cum.index, diff_cum.index[1:])
-        ]
-        # Need to know which years are leap years for our index:
-        dayspryear = [
-            365 if not calendar.isleap(x.year) else 366
-            for x in pd.to_datetime(diff_cum.index[1:])
-        ]
-        # Float-contribution to years from days:
-        days = [
-            t[0] / float(t[1]) for t in zip([r.days for r in rel_deltas], dayspryear)
-        ]
-        floatyearsnodays = [r.years + r.months / 12.0 for r in rel_deltas]
-        floatyears = [x + y for x, y in zip(floatyearsnodays, days)]
-
-        # Calculate month-difference:
-        floatmonthsnodays = [r.years * 12.0 + r.months for r in rel_deltas]
-        # How many days pr. month? We check this for the right
-        # end of the relevant time interval.
-        daysprmonth = [
-            calendar.monthrange(t.year, t.month)[1] for t in diff_cum.index[1:]
-        ]
-        days = [
-            t[0] / float(t[1]) for t in zip([r.days for r in rel_deltas], daysprmonth)
-        ]
-        floatmonths = [x + y for x, y in zip(floatmonthsnodays, days)]
-
-        diff_cum["DAYS"] = whole_days + [0]
-        diff_cum["MONTHS"] = floatmonths + [0]
-        diff_cum["YEARS"] = floatyears + [0]
+        whole_days, floatmonths, floatyears = _interval_lengths(diff_cum.index)
+        diff_cum["DAYS"] = np.append(whole_days, 0)
+        diff_cum["MONTHS"] = np.append(floatmonths, 0)
+        diff_cum["YEARS"] = np.append(floatyears, 0)
         for vec in column_keys:
             diff_cum[vec] = diff_cum[vec] / diff_cum[time_unit.upper()]
         # Drop temporary columns
@@ -126,6 +95,64 @@ def compute_volumetric_rates(realization, column_keys, time_index, time_unit):
     return diff_cum
 
 
+def _interval_lengths(dates):
+    """Compute the length of each interval between consecutive dates,
+    in days, months and years.
+
+    Months and years are counted as for dateutil's relativedelta, as whole
+    calendar months with the leftover days as a fraction of the month
+    length or year length at the end of the interval. Month lengths and
+    leap years are thus correctly handled.
+
+    Args:
+        dates: Sorted dates or datetimes, at least one.
+
+    Returns:
+        tuple of three numpy arrays with one element less than dates:
+        Whole days, float months and float years.
+    """
+    dates = np.array(dates, dtype="datetime64[us]")
+    start = dates[:-1]
+    end = dates[1:]
+    one_day = np.timedelta64(1, "D")
+    whole_days = (end - start) // one_day
+
+    def _month_lengths(months):
+        return (months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")
+
+    def _add_months(months_to_add):
+        # Add months to the interval starts, clipping the day to the
+        # length of the resulting month (as relativedelta does)
+        months = start.astype("datetime64[M]") + months_to_add
+        dayno = np.minimum(
+            start.astype("datetime64[D]") - start.astype("datetime64[M]"),
+            _month_lengths(months) - one_day,
+        )
+        return (
+            months.astype("datetime64[D]")
+            + dayno
+            + (start - start.astype("datetime64[D]"))
+        )
+
+    # Whole months between the dates, one less if the day in the
+    # end month is not reached:
+    whole_months = (end.astype("datetime64[M]") - start.astype("datetime64[M]")).astype(
+        np.int64
+    )
+    whole_months = whole_months - (_add_months(whole_months) > end)
+    leftover_days = (end - _add_months(whole_months)) // one_day
+
+    years, months = np.divmod(whole_months, 12)
+    endyears = end.astype("datetime64[Y]")
+    daysprmonth = _month_lengths(end.astype("datetime64[M]")) // one_day
+    dayspryear = (
+        (endyears + 1).astype("datetime64[D]") - endyears.astype("datetime64[D]")
+    ) // one_day
+    floatmonths = (years * 12.0 + months) + leftover_days / daysprmonth
+    floatyears = (years + months / 12.0) + leftover_days / dayspryear
+    return whole_days, floatmonths, floatyears
+
+
 def cumcolumn_to_ratecolumn(smrycolumn):
     """Converts a cumulative summary column name to the
     corresponding rate column name.
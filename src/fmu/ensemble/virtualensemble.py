@@ -4,7 +4,6 @@ import datetime
 import fnmatch
 import logging
 import os
-import re
 import shutil
 import warnings
 
@@ -13,6 +12,7 @@ import pandas as pd
 import yaml
 
 from .ensemblecombination import EnsembleCombination
+from .util import GROUPBYCOLUMNCANDIDATES, QUANTILEMATCHER, ShortcutCache, shortcut2path
 from .virtualrealization import VirtualRealization
 
 try:
@@ -24,6 +24,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Dumped frames that are internalized without a .csv extension
+UNSUFFIXED_FILEBASES = (".txt", "STATUS", "OK")
+
 
 class VirtualEnsemble(object):
     """A computed or archived ensemble
@@ -85,6 +88,12 @@ class VirtualEnsemble(object):
         else:
             self.data = {}
 
+        # Dataframes from add_realization() that are not yet concatenated
+        # into self.data, pr. key. Adding many realizations in a row then
+        # costs one concatenation pr. key, done when data is accessed.
+        # One-row data (dicts and scalars) is kept as dicts until then.
+        self._pending_frames = {}
+
         # We support having some dataframes only on disk, for faster
         # initialization of the VirtualEnsemble object. This
         # dictionary have the same keys as self.data and the value is
@@ -92,9 +101,51 @@ class VirtualEnsemble(object):
         # overlap of keys in self.data and self.lazy_frames.
         self.lazy_frames = {}
 
+        # Cache for shortcut2path() lookups in self.keys()
+        self._shortcuts = ShortcutCache()
+
+        # Row positions pr. realization for each frame, see _real_rows()
+        self._real_rows_cache = {}
+
         if fromdisk:
             self.from_disk(fromdisk, lazy_load=lazy_load)
 
+    @property
+    def data(self):
+        """Dictionary with the internalized dataframes, indexed by localpath"""
+        if self._pending_frames:
+            self._concat_pending_frames()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._pending_frames = {}
+
+    def _concat_pending_frames(self):
+        """Concatenate frames from add_realization() into the datastore"""
+        for key, pending in self._pending_frames.items():
+            if key not in self._data and len(pending) == 1:
+                if isinstance(pending[0], dict):
+                    self._data[key] = pd.DataFrame(pending, index=[1])
+                else:
+                    self._data[key] = pending[0]
+                continue
+            frames = [self._data[key]] if key in self._data else []
+            rows = []
+            for item in pending:
+                if isinstance(item, dict):
+                    rows.append(item)
+                    continue
+                if rows:
+                    frames.extend(_rows_to_frames(rows))
+                    rows = []
+                frames.append(item)
+            if rows:
+                frames.extend(_rows_to_frames(rows))
+            self._data[key] = pd.concat(frames, ignore_index=True, sort=True)
+        self._pending_frames = {}
+
     def __len__(self):
         """Return the number of realizations (integer) included in the
         ensemble"""
@@ -119,11 +170,15 @@ class VirtualEnsemble(object):
         """
 
         # Check all dataframes:
-        idxset = set()
-        for key in self.data.keys():
-            if key != "__smry_metadata":
-                idxset = idxset | set(self.data[key]["REAL"].unique())
-        self.realindices = list(idxset)
+        realcolumns = [
+            frame["REAL"].to_numpy()
+            for key, frame in self.data.items()
+            if key != "__smry_metadata"
+        ]
+        if realcolumns:
+            self.realindices = list(np.unique(np.concatenate(realcolumns)))
+        else:
+            self.realindices = []
 
     def keys(self):
         """Return all keys in the internal datastore
@@ -158,11 +213,8 @@ class VirtualEnsemble(object):
         of ambiguity, the shortpath will be returned.
 
         """
-        # pylint: disable=import-outside-toplevel
-        from .ensemble import shortcut2path
-
         if keys is None:
-            return shortcut2path(self.keys(), shortpath)
+            return self._shortcuts.resolve(self.keys(), shortpath)
         return shortcut2path(keys, shortpath)
 
     def __getitem__(self, localpath):
@@ -186,32 +238,68 @@ class VirtualEnsemble(object):
         Returns:
             VirtualRealization, populated with data.
         """
+        vreal = self._slice_realization(realindex, self.data.keys())
+        if vreal.keys():
+            # Add the smry metadata to the realization
+            if "__smry_metadata" in self.keys():
+                vreal.append("__smry_metadata", self.get_df("__smry_metadata"))
+            return vreal
+        raise ValueError("No data for realization %d" % realindex)
+
+    def _slice_realization(self, realindex, keys):
+        """Build a virtual realization from a subset of the datastore
+
+        Args:
+            realindex (int): Realization index to slice frames by.
+            keys (list of str): Fully qualified localpaths to include.
+                Keys with no data for the realization are left out.
+
+        Returns:
+            VirtualRealization, possibly without any data.
+        """
         vreal = VirtualRealization(
             description="Realization %d from %s" % (realindex, self._name)
         )
-        for key in self.data.keys():
-            data = self.get_df(key)
-            if key != "__smry_metadata":
+        for key in keys:
+            if key == "__smry_metadata":
                 # Special treatment of the internal special frame
-                # that is constant over all realizations
-                realizationdata = data[data["REAL"] == realindex]
+                # that is constant over all realizations.
+                continue
+            rows = self._real_rows(key).get(realindex)
+            if rows is None:
+                continue
+            realizationdata = self.data[key].take(rows)
             if len(realizationdata) == 1:
                 # Convert scalar values to dictionaries, avoiding
                 # getting length-one-series returned later on access.
                 realizationdata = realizationdata.iloc[0].to_dict()
-            elif len(realizationdata) > 1:
-                realizationdata.reset_index(inplace=True, drop=True)
             else:
-                continue
+                realizationdata.reset_index(inplace=True, drop=True)
             if "REAL" in realizationdata:
                 del realizationdata["REAL"]
             vreal.append(key, realizationdata)
-        if vreal.keys():
-            # Add the smry metadata to the realization
-            if "__smry_metadata" in self.keys():
-                vreal.append("__smry_metadata", self.get_df("__smry_metadata"))
-            return vreal
-        raise ValueError("No data for realization %d" % realindex)
+        return vreal
+
+    def _real_rows(self, key):
+        """Row positions pr. realization index for a frame in the datastore
+
+        The result is cached together with a copy of the REAL column,
+        and recomputed whenever the column has changed. Frames are
+        handed out by reference in get_df() and may be modified in place.
+
+        Args:
+            key (str): Fully qualified localpath
+
+        Returns:
+            dict: Realization indices mapped to arrays of row positions
+        """
+        dframe = self.data[key]
+        reals = dframe["REAL"].to_numpy()
+        cached = self._real_rows_cache.get(key)
+        if cached is None or not np.array_equal(cached[0], reals):
+            cached = (reals.copy(), dframe.groupby("REAL").indices)
+            self._real_rows_cache[key] = cached
+        return cached[1]
 
     def add_realization(self, realization, realidx=None, overwrite=False):
         """Add a realization. A ScratchRealization will be effectively
@@ -237,28 +325,29 @@ class VirtualEnsemble(object):
         if not realidx:
             realidx = realization.index
 
-        if not overwrite and realidx in self.realindices:
-            raise ValueError("Error, realization index already present")
-        if overwrite and realidx in self.realindices:
+        if realidx in self.realindices:
+            if not overwrite:
+                raise ValueError("Error, realization index already present")
             self.remove_realizations(realidx)
 
         # Add the data from the incoming realization key by key
         for key in realization.keys():
             dframe = realization.get_df(key)
+            # The REAL column is added to new rows, while incoming
+            # frames are copied, not modified in place.
             if isinstance(dframe, dict):  # dicts to go to one-row dataframes
-                dframe = pd.DataFrame(index=[1], data=dframe)
-            if isinstance(dframe, (str, int, float)):
-                dframe = pd.DataFrame(index=[1], columns=[key], data=dframe)
-            dframe["REAL"] = realidx
-            if key not in self.data and key in self.lazy_frames:
-                self.get_df(key)  # Trigger load from disk.
-            if key not in self.data.keys():
-                self.data[key] = dframe
+                dframe = {**dframe, "REAL": realidx}
+            elif isinstance(dframe, (str, int, float, np.number)):
+                dframe = {key: dframe, "REAL": realidx}
             else:
-                self.data[key] = pd.concat(
-                    [self.data[key], dframe], ignore_index=True, sort=True
-                )
-        self.update_realindices()
+                dframe = dframe.assign(REAL=realidx)
+            if key in self.lazy_frames:
+                self.get_df(key)  # Trigger load from disk.
+            self._pending_frames.setdefault(key, []).append(dframe)
+        # The index is not known at this point, it was either
+        # not present or just removed above:
+        if any(key != "__smry_metadata" for key in realization.keys()):
+            self.realindices.append(realidx)
 
     def remove_realizations(self, deleteindices):
         """Remove realizations from internal data
@@ -283,12 +372,14 @@ class VirtualEnsemble(object):
         # Trigger load of any lazy frames:
         for key in list(self.lazy_frames.keys()):
             self.get_df(key)
-        # There might be Pandas tricks to avoid this outer loop.
-        for realindex in indicestodelete:
+        if indicestodelete:
             for key in self.data:
                 if key != "__smry_metadata":
-                    self.data[key] = self.data[key][self.data[key]["REAL"] != realindex]
-        self.update_realindices()
+                    dframe = self.data[key]
+                    self.data[key] = dframe[~dframe["REAL"].isin(indicestodelete)]
+        self.realindices = [
+            realidx for realidx in self.realindices if realidx not in indicestodelete
+        ]
         logger.info(
             "Removed %s realization(s) from VirtualEnsemble", len(indicestodelete)
         )
@@ -321,7 +412,8 @@ class VirtualEnsemble(object):
         Arguments:
             aggregation: string, supported modes are
                 'mean', 'median', 'p10', 'p90', 'min',
-                'max', 'std, 'var', 'pXX' where X is a number
+                'max', 'std, 'var', 'pXX' where XX is a number
+                between 0 and 100
             keylist: list of strings, indicating which keys
                 in the internal datastore to include. If list is empty
                 (default), all data will be attempted included.
@@ -332,12 +424,11 @@ class VirtualEnsemble(object):
 
         WARNING: CODE DUPLICATION from ensemble.py
         """
-        quantilematcher = re.compile(r"p(\d\d)")
+        quantilematch = QUANTILEMATCHER.match(aggregation)
         supported_aggs = ["mean", "median", "min", "max", "std", "var"]
-        if aggregation not in supported_aggs and not quantilematcher.match(aggregation):
+        if aggregation not in supported_aggs and not quantilematch:
             raise ValueError(
-                "{arg} is not a".format(arg=aggregation)
-                + "supported ensemble aggregation"
+                "{arg} is not a supported ensemble aggregation".format(arg=aggregation)
             )
 
         # Generate a new empty object:
@@ -368,19 +459,8 @@ class VirtualEnsemble(object):
                 continue
             data = self.get_df(key).drop(columns="REAL")
 
-            # Look for data we should group by. This would be beneficial
-            # to get from a metadata file, and not by pure guesswork.
-            groupbycolumncandidates = [
-                "DATE",
-                "FIPNUM",
-                "ZONE",
-                "REGION",
-                "JOBINDEX",
-                "Zone",
-                "Region_index",
-            ]
-
-            groupby = [x for x in groupbycolumncandidates if x in data.columns]
+            # Look for data we should group by.
+            groupby = [x for x in GROUPBYCOLUMNCANDIDATES if x in data.columns]
 
             # Filter to only numerical columns and groupby columns:
             numerical_and_groupby_cols = list(
@@ -388,14 +468,13 @@ class VirtualEnsemble(object):
             )
             data = data[numerical_and_groupby_cols]
 
-            dtypes = data.dtypes.unique()
-            if not (int in dtypes or float in dtypes):
+            if data.select_dtypes(include="number").empty:
                 logger.info("No numerical data to aggregate in %s", key)
                 continue
             aggobject = data.groupby(groupby) if groupby else data
 
-            if quantilematcher.match(aggregation):
-                quantile = int(quantilematcher.match(aggregation).group(1))
+            if quantilematch:
+                quantile = int(quantilematch.group(1))
                 aggregated = aggobject.quantile(q=quantile / 100.0)
             else:
                 # Passing through the variable 'aggregation' to
@@ -597,7 +676,7 @@ file is picked up"""
             # Trim .csv from end of dict-key
             # .csv will be reinstated by logic in from_disk()
             # parameters.txt or STATUS ends here
-            filebase = filename[:-4] if filename[-4:] == ".csv" else filename
+            filebase = filename[:-4] if filename.endswith(".csv") else filename
 
             if not isinstance(data, pd.DataFrame):
                 raise ValueError("VirtualEnsembles should " + "only store DataFrames")
@@ -676,35 +755,18 @@ file is picked up"""
                 # We will loop through the directory structure, and
                 # data will be duplicated as they can be both in csv
                 # and parquet files. We will only load one of them if so.
-                elif filename[-4:] == ".csv":
+                elif filename.endswith(".csv"):
                     filebase = filename[:-4]
                     parquetfile = filebase + ".parquet"
-                    # Treat special cases (!!!) NB: Code duplication below
-                    if (
-                        filebase[-4:] == ".txt"
-                        or filebase[-6:] == "STATUS"
-                        or filebase[-2:] == "OK"
-                        or filebase[0:2] == "__"
-                    ):
-                        internalizedkey = os.path.join(localpath, filebase)
-                    else:
-                        internalizedkey = os.path.join(localpath, filebase + ".csv")
+                    internalizedkey = _internalized_key(localpath, filebase)
                     if fmt == "csv" or not os.path.exists(
                         os.path.join(root, parquetfile)
                     ):
                         self.lazy_frames[internalizedkey] = os.path.join(root, filename)
 
-                elif filename[-8:] == ".parquet":
+                elif filename.endswith(".parquet"):
                     filebase = filename[:-8]
-                    if (
-                        filebase[-4:] == ".txt"
-                        or filebase[-6:] == "STATUS"
-                        or filebase[-2:] == "OK"
-                        or filebase[0:2] == "__"
-                    ):
-                        internalizedkey = os.path.join(localpath, filebase)
-                    else:
-                        internalizedkey = os.path.join(localpath, filebase + ".csv")
+                    internalizedkey = _internalized_key(localpath, filebase)
                     if fmt == "parquet":
                         self.lazy_frames[internalizedkey] = os.path.join(root, filename)
                 else:
@@ -770,8 +832,7 @@ file is picked up"""
                 "Internal error, inconsistent lazy frames:\n %s",
                 str(inconsistent_lazy_frames),
             )
-        allfullpaths = list(self.data.keys()) + list(self.lazy_frames.keys())
-        fullpath = self.shortcut2path(localpath, keys=allfullpaths)
+        fullpath = self._shortcuts.resolve(self.keys(), localpath)
         if fullpath not in self.data.keys():
             # Need to lazy load it:
             logger.warning("Loading %s from disk, was lazy", fullpath)
@@ -851,11 +912,11 @@ file is picked up"""
         smry_path = "unsmry--" + chosen_smry
         smry = self.get_df(smry_path)
         smry_interpolated = []
-        for realidx in smry["REAL"].unique():
+        for realidx, realsmry in smry.groupby("REAL", sort=False):
             logger.info("Creating VirtualRealization index %s", str(realidx))
             vreal = VirtualRealization(str(realidx))
             # Inject the summary data for that specific realization
-            vreal.append(smry_path, smry[smry["REAL"] == realidx])
+            vreal.append(smry_path, realsmry)
 
             # Now ask the VirtualRealization to do interpolation
             interp = vreal.get_smry(column_keys=column_keys, time_index=time_index)
@@ -922,9 +983,12 @@ file is picked up"""
         # Build a dictionary of dataframes to be concatenated
         dframes = {}
         dframes["mean"] = dframe.mean()
-        for quantile in quantiles:
-            quantile_str = "p" + str(quantile)
-            dframes[quantile_str] = dframe.quantile(q=1 - quantile / 100.0)
+        if quantiles:
+            qvalues = sorted({1 - quantile / 100.0 for quantile in quantiles})
+            quantileframe = dframe.quantile(q=qvalues)
+            for quantile in quantiles:
+                quantile_str = "p" + str(quantile)
+                dframes[quantile_str] = quantileframe.xs(1 - quantile / 100.0, level=-1)
         dframes["maximum"] = dframe.max()
         dframes["minimum"] = dframe.min()
 
@@ -965,12 +1029,12 @@ file is picked up"""
                 is compatible with the date index and the cumulative data.
 
         """
+        # Only summary data is needed for the rates, there is no need to
+        # slice any other internalized data pr. realization:
+        smry_keys = [key for key in self.data.keys() if "unsmry" in key]
         vol_rates_dfs = []
         for realidx in self.realindices:
-            # Warning: This is potentially a big overhead
-            # if a lot of non-summary-related data has been
-            # internalized:
-            vreal = self.get_realization(realidx)
+            vreal = self._slice_realization(realidx, smry_keys)
             vol_rate_df = vreal.get_volumetric_rates(column_keys, time_index, time_unit)
             # Indexed by DATE, ensure index name is correct:
             vol_rate_df.index = vol_rate_df.index.set_names(["DATE"])
@@ -1147,3 +1211,47 @@ file is picked up"""
             )
             return False
         return True
+
+
+def _internalized_key(localpath, filebase):
+    """Determine the datastore key for a frame dumped by to_disk()
+
+    The .csv extension is trimmed from keys when dumping, and must be
+    reinstated, except for special cases like parameters.txt and STATUS.
+
+    Args:
+        localpath (str): Directory of the file relative to the dump
+        filebase (str): Filename without its .csv or .parquet extension
+
+    Returns:
+        str: Fully qualified localpath in the datastore
+    """
+    if filebase.endswith(UNSUFFIXED_FILEBASES) or filebase.startswith("__"):
+        return os.path.join(localpath, filebase)
+    return os.path.join(localpath, filebase + ".csv")
+
+
+def _rows_to_frames(rows):
+    """Make dataframes from a list of dicts, each dict being one row
+
+    When all values are plain strings or numbers, one dataframe is made
+    for all rows. Otherwise (booleans, None, NaN etc.), there is one
+    dataframe pr. row, as the dtypes pandas infers for those when
+    concatenating frames differ from what it infers for a list of dicts.
+
+    Args:
+        rows (list of dict): Values pr. column name
+
+    Returns:
+        list of pd.DataFrame
+    """
+    plain = all(
+        isinstance(value, (str, float, int, np.number))
+        and not isinstance(value, (bool, np.bool_))
+        and not pd.isna(value)
+        for row in rows
+        for value in row.values()
+    )
+    if plain:
+        return [pd.DataFrame(rows)]
+    return [pd.DataFrame([row], index=[1]) for row in rows]
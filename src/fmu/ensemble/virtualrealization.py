@@ -369,19 +369,29 @@ class VirtualRealization(object):
         smry = smry[~smry.index.duplicated(keep="first")]
 
         smry.sort_index(inplace=True)
-        smry = smry.apply(pd.to_numeric)
+        # Only columns not already numerical need conversion
+        nonnumeric_columns = [
+            column
+            for column, dtype in smry.dtypes.items()
+            if not pd.api.types.is_numeric_dtype(dtype)
+        ]
+        if nonnumeric_columns:
+            smry[nonnumeric_columns] = smry[nonnumeric_columns].apply(pd.to_numeric)
 
         cummask = smry_cumulative(column_keys)
         cum_columns = [column_keys[i] for i in range(len(column_keys)) if cummask[i]]
         noncum_columns = [
             column_keys[i] for i in range(len(column_keys)) if not cummask[i]
         ]
-        if cum_columns:
-            smry[cum_columns] = (
-                smry[cum_columns].interpolate(method="time").ffill().bfill()
-            )
-        if noncum_columns:
-            smry[noncum_columns] = smry[noncum_columns].bfill().fillna(value=0)
+        # Fill each group of columns as a block, and assemble the
+        # result once instead of assigning back into smry.
+        smry = pd.concat(
+            [
+                smry[cum_columns].interpolate(method="time").ffill().bfill(),
+                smry[noncum_columns].bfill().fillna(value=0),
+            ],
+            axis=1,
+        )[column_keys]
 
         smry.index = smry.index.set_names(["DATE"])
         return smry.loc[pd.to_datetime(time_index_dt)]
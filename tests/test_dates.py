@@ -2,7 +2,7 @@ from datetime import datetime as dt
 
 import pytest
 
-from fmu.ensemble.util.dates import _fallback_date_roll, date_range
+from fmu.ensemble.util.dates import _fallback_date_roll, date_range, parse_date
 
 # These tests are duplicated from https://github.com/equinor/res2df/blob/master/tests/test_summary.py
 
@@ -180,3 +180,16 @@ def test_date_range(start, end, freq, expected):
     """When dates are beyond year 2262,
     the function _fallback_date_range() is triggered."""
     assert date_range(start, end, freq) == expected
+
+
+@pytest.mark.parametrize(
+    "datestr, expected",
+    [
+        ("2002-11-25", dt(2002, 11, 25)),
+        ("2002-11-25 00:00:01", dt(2002, 11, 25, 0, 0, 1)),
+        ("25 Nov 2002", dt(2002, 11, 25)),
+    ],
+)
+def test_parse_date(datestr, expected):
+    """Test parsing of date strings, with and without the dateutil fallback"""
+    assert parse_date(datestr) == expected
@@ -257,6 +257,35 @@ def test_smry_labels():
     assert mismatch["LABEL"].values == ["WBP4_OP_1_01"]
 
 
+def test_smry_mixed_datetypes():
+    """Observation dates for the same key can be both dates and datetimes"""
+    testdir = os.path.dirname(os.path.abspath(__file__))
+    real = ScratchRealization(
+        testdir + "/data/testensemble-reek001/" + "realization-0/iter-0/"
+    )
+    real.load_smry()
+    obs = Observations(
+        {
+            "smry": [
+                {
+                    "key": "FOPT",
+                    "observations": [
+                        {"value": 1000, "error": 1, "date": datetime.date(2001, 1, 1)},
+                        {
+                            "value": 2000,
+                            "error": 1,
+                            "date": datetime.datetime(2002, 1, 1, 12, 0, 0),
+                        },
+                    ],
+                }
+            ]
+        }
+    )
+    mismatch = obs.mismatch(real)
+    assert len(mismatch) == 2
+    assert mismatch["SIMVALUE"].notna().all()
+
+
 def test_errormessages():
     """Test that we give ~sensible error messages when the
     observation input is unparseable"""
@@ -999,8 +999,13 @@ def test_drop():
     real.drop("unsmry--monthly", rowcontains="2000-01-01")
     assert len(real.get_df("unsmry--monthly")) == datecount - 1
 
+    assert real.contains("parameters")
     real.drop("parameters")
     assert "parameters.txt" not in real.keys()
+    # Shorthand lookups must not be served from a stale cache:
+    assert not real.contains("parameters")
+    real.load_txt("parameters.txt", force_reread=True)
+    assert real.contains("parameters")
 
 
 def test_find_files_comps():
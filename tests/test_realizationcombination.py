@@ -1,8 +1,11 @@
 """Testing fmu-ensemble."""
 
+import datetime
 import logging
 import os
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from fmu import ensemble
@@ -50,6 +53,8 @@ def test_realizationcombination_basic():
     assert "FWL" in scaled_vreal0["parameters"]
     assert "FWL" in scaled_vreal0.parameters
     assert scaled_vreal0.parameters["FWL"] == real0.parameters["FWL"] * 3
+    assert (0 * vreal0)["npv.txt"] == 0
+    assert (vreal0 * 0)["parameters"]["FWL"] == 0
 
     vdiff = vreal1 - vreal0
     assert "FWPR" in vdiff["unsmry--yearly"]
@@ -60,10 +65,25 @@ def test_realizationcombination_basic():
     with pytest.raises((KeyError, ValueError)):
         vdiff_filtered.get_df("unsmry--yearly")
 
+    # The same subtree occuring twice in an expression:
+    vdiff_twice = (vdiff + vdiff).to_virtual(keyfilter=["parameters", "npv"])
+    assert vdiff_twice["npv.txt"] == 2 * vdiff["npv.txt"]
+    assert vdiff_twice["parameters"]["FWL"] == 2 * vdiff["parameters"]["FWL"]
+
     vdiff_filtered2 = vdiff.to_virtual(keyfilter="unsmry--yearly")
     assert "parameters.txt" not in vdiff_filtered2.keys()
     assert "FWPR" in vdiff_filtered2.get_df("unsmry--yearly")
 
+    realsum = real0 + real1
+    smry_dates = realsum.get_smry_dates("yearly")
+    smry_sum = realsum.get_smry(column_keys="FOPT", time_index="yearly")
+    assert list(smry_sum["DATE"]) == smry_dates
+    assert (
+        smry_sum["FOPT"].values
+        == real0.get_smry(column_keys="FOPT", time_index=smry_dates)["FOPT"].values
+        + real1.get_smry(column_keys="FOPT", time_index=smry_dates)["FOPT"].values
+    ).all()
+
     smrymeta = realdiff.get_smry_meta(["FO*"])
     assert "FOPT" in smrymeta
 
@@ -72,6 +92,86 @@ def test_realizationcombination_basic():
     assert "FWCT" in smry_params
 
 
+def test_realizationcombination_smry_dates(monkeypatch):
+    """Summary dates of a combination are the union of the dates
+    in all involved realizations, also the subtracted ones"""
+    if "__file__" in globals():
+        # Easen up copying test code into interactive sessions
+        testdir = os.path.dirname(os.path.abspath(__file__))
+    else:
+        testdir = os.path.abspath(".")
+
+    real0 = ensemble.ScratchRealization(
+        os.path.join(testdir, "data/testensemble-reek001", "realization-0/iter-0")
+    )
+    real1 = ensemble.ScratchRealization(
+        os.path.join(testdir, "data/testensemble-reek001", "realization-1/iter-0")
+    )
+    real0_dates = real0.get_smry_dates("yearly")
+    # Let the subtracted realization have a date the other lacks:
+    extra_date = datetime.date(2010, 1, 1)
+    monkeypatch.setattr(
+        real1,
+        "get_smry_dates",
+        lambda *args, **kwargs: real0_dates + [extra_date],
+    )
+
+    diff_dates = (real0 - real1).get_smry_dates("yearly")
+    assert diff_dates == real0_dates + [extra_date]
+    assert (real1 - real0).get_smry_dates("yearly") == diff_dates
+
+
+def test_realizationcombination_dict_and_scalar():
+    """Scalars in a combination with dictionaries apply to every
+    numerical value in the dictionaries"""
+    vreal0 = ensemble.VirtualRealization(
+        "dict", {"foo": {"A": 1, "B": 2.5, "NAME": "bar"}}
+    )
+    vreal1 = ensemble.VirtualRealization("scalar", {"foo": 10})
+
+    assert (vreal0 - vreal1)["foo"] == {"A": -9, "B": -7.5}
+    assert (vreal1 - 2 * vreal0)["foo"] == {"A": 8, "B": 5}
+
+
+def test_realizationcombination_frames():
+    """Dataframes are aligned on the guessed index, also when index
+    values are repeated, and integer data stays integer"""
+    vreal0 = ensemble.VirtualRealization(
+        "zero",
+        {
+            "volumes": pd.DataFrame(
+                {
+                    "ZONE": ["Upper", "Upper", "Lower"],
+                    "FACIES": ["sand", "shale", "sand"],
+                    "STOIIP": [1.0, 2.0, 3.0],
+                }
+            ),
+            "counts": pd.DataFrame({"ZONE": ["Upper", "Lower"], "CELLS": [1, 2]}),
+        },
+    )
+    vreal1 = ensemble.VirtualRealization(
+        "one",
+        {
+            "volumes": pd.DataFrame(
+                {
+                    "ZONE": ["Upper", "Upper", "Upper", "Lower"],
+                    "FACIES": ["sand", "shale", "coal", "sand"],
+                    "STOIIP": [10.0, 20.0, 5.0, 30.0],
+                }
+            ),
+            "counts": pd.DataFrame({"ZONE": ["Upper", "Lower"], "CELLS": [10, 20]}),
+        },
+    )
+
+    volumes = (vreal1 - vreal0).get_df("volumes")
+    assert "ZONE" in volumes
+    assert "STOIIP" in volumes
+
+    counts = (vreal1 - vreal0).get_df("counts")
+    assert counts["CELLS"].dtype == np.int64
+    assert list(counts["CELLS"]) == [9, 18]
+
+
 def test_realizationcomb_virt_meta():
     """Test metadata aggregation of combinations
     of virtualized realizations"""
@@ -6,7 +6,7 @@ import logging
 import numpy as np
 import pytest
 
-from fmu.ensemble.util import flatten, parse_number, shortcut2path
+from fmu.ensemble.util import ShortcutCache, flatten, parse_number, shortcut2path
 from fmu.ensemble.util.dates import normalize_dates
 from fmu.ensemble.util.rates import cumcolumn_to_ratecolumn
 
@@ -70,6 +70,12 @@ def test_parse_number():
     assert parse_number("1e10") == 1e10
     assert parse_number("1.2") == 1.2
     assert parse_number("foobar") == "foobar"
+    assert parse_number("-.5") == -0.5
+    assert parse_number("+3") == 3
+    assert parse_number(" 3 ") == 3
+    assert parse_number("1_000") == 1000
+    assert parse_number("inf") == float("inf")
+    assert parse_number("1.2.3") == "1.2.3"
 
     assert isinstance(parse_number("2.00"), float)
     assert isinstance(parse_number("2"), int)
@@ -87,3 +93,23 @@ def test_shortcut2path():
     assert shortcut2path([], "foo") == "foo"
     assert shortcut2path(["bar"], "foo") == "foo"
     assert shortcut2path(["foo1/bar/ambig", "foo2/bar/ambig"], "ambig") == "ambig"
+    assert shortcut2path(["foo/bar.csv"], "foo/bar") == "foo/bar.csv"
+    assert shortcut2path(["foo/bar.csv"], "bar") == "foo/bar.csv"
+    assert shortcut2path(["foo/bar.csv", "com/bar.csv"], "bar") == "bar"
+    assert shortcut2path(["foo/bar.csv", "com/bar.csv"], "foo/bar") == "foo/bar.csv"
+    # Only the last extension is stripped:
+    assert shortcut2path(["foo/bar.tar.gz"], "bar.tar") == "foo/bar.tar.gz"
+    assert shortcut2path(["foo/bar.tar.gz"], "bartar") == "bartar"
+    # Fully qualified paths take precedence over shorthands:
+    assert shortcut2path(["foo/bar", "foo/bar.csv"], "foo/bar") == "foo/bar"
+
+
+def test_shortcutcache():
+    """Cached shortcut lookups must follow changes to the keys"""
+    shortcuts = ShortcutCache()
+    keys = {"foo/bar.csv": None}
+    assert shortcuts.resolve(keys, "bar") == "foo/bar.csv"
+    keys["com/bar.csv"] = None
+    assert shortcuts.resolve(keys, "bar") == "bar"
+    del keys["foo/bar.csv"]
+    assert shortcuts.resolve(keys, "bar") == "com/bar.csv"
@@ -192,8 +192,19 @@ def test_virtualensemble():
         vens.get_realization(9999)
 
     assert vens.shortcut2path("betterdata") == "betterdata"
+
+    # Build a virtual ensemble realization by realization:
+    rebuilt = VirtualEnsemble("rebuilt")
+    for realidx in [1, 2, 80]:
+        rebuilt.add_realization(vens.get_realization(realidx), realidx=realidx)
+    assert len(rebuilt) == 3
+    assert sorted(rebuilt["betterdata"]["REAL"]) == [1, 2, 80]
+    assert rebuilt.get_realization(80).get_df("betterdata")["NPV"] == 9
     assert vens.agg("min").get_df("betterdata")["NPV"] == 9
     assert vens.agg("max").get_df("betterdata")["NPV"] == 6000
+    assert vens.agg("p100").get_df("betterdata")["NPV"] == 6000
+    with pytest.raises(ValueError):
+        vens.agg("p101")
     assert (
         vens.agg("min").get_df("betterdata")["NPV"]
         < vens.agg("p07").get_df("betterdata")["NPV"]
@@ -209,11 +220,41 @@ def test_virtualensemble():
 
     assert "REAL" not in vens.agg("min")["STATUS"].columns
 
+    # Numerical data need not be 64-bit to be aggregated:
+    vens.append(
+        "float32data",
+        pd.DataFrame({"REAL": [0, 1], "NPV": [1.0, 3.0]}).astype({"NPV": "float32"}),
+    )
+    assert vens.agg("mean").get_df("float32data")["NPV"] == 2.0
+
     # Betterdata should be returned as a dictionary
     # (it is returned from a virtualrealization object)
     assert isinstance(vens.agg("min").get_df("betterdata"), dict)
 
 
+def test_get_realization_inplace_edit():
+    """Realization slicing must follow in-place edits of frames
+    returned from get_df()"""
+    vens = VirtualEnsemble(
+        name="inplace",
+        data={
+            "foo.csv": pd.DataFrame(
+                {"REAL": [0, 0, 1, 1, 2, 2], "VALUE": [0, 1, 10, 11, 20, 21]}
+            )
+        },
+    )
+    assert sorted(vens.get_realization(2).get_df("foo.csv")["VALUE"]) == [20, 21]
+
+    vens.get_df("foo.csv").sort_values("REAL", ascending=False, inplace=True)
+    assert sorted(vens.get_realization(2).get_df("foo.csv")["VALUE"]) == [20, 21]
+    assert sorted(vens.get_realization(0).get_df("foo.csv")["VALUE"]) == [0, 1]
+
+    vens.get_df("foo.csv").drop(index=[0, 1, 2, 3], inplace=True)
+    assert sorted(vens.get_realization(2).get_df("foo.csv")["VALUE"]) == [20, 21]
+    with pytest.raises(ValueError):
+        vens.get_realization(0)
+
+
 def test_todisk(tmpdir):
     """Test that we can write VirtualEnsembles to the filesystem in a
     retrievable manner"""